@@ -2,6 +2,7 @@
 # Standard Library
 # pylint: disable=not-an-iterable
 import concurrent.futures
+import time
 
 # Third Party Libraries
 from gi.repository import GLib, GObject, Gtk
@@ -15,13 +16,17 @@ from lutris.util import system
 from lutris.util.image_type import ImageType
 from lutris.util.jobs import AsyncCall
 from lutris.util.log import logger
-from lutris.util.resources import download_media, get_image_path, update_desktop_icons
+from lutris.util.resources import MEDIA_WORKERS, download_media, get_image_path, update_desktop_icons
 
 from . import (
     COL_ICON, COL_ID, COL_INSTALLED, COL_INSTALLED_AT, COL_INSTALLED_AT_TEXT, COL_LASTPLAYED, COL_LASTPLAYED_TEXT,
     COL_NAME, COL_PLATFORM, COL_PLAYTIME, COL_PLAYTIME_TEXT, COL_RUNNER, COL_RUNNER_HUMAN_NAME, COL_SLUG, COL_YEAR
 )
 
+# Shared by all stores so repeated library refreshes don't pay
+# thread creation costs; workers are only spawned on first use.
+MEDIA_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=MEDIA_WORKERS, thread_name_prefix="media")
+
 
 def try_lower(value):
     try:
@@ -81,6 +86,8 @@ class GameStore(GObject.Object):
         "playtime_text": COL_PLAYTIME_TEXT,
     }
 
+    icon_flush_batch_size = 16  # icon-loaded emissions per main loop wakeup
+
     def __init__(
         self,
         games,
@@ -374,22 +381,38 @@ class GameStore(GObject.Object):
         if not downloads:
             return
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            future_downloads = {
-                executor.submit(download_media, url, dest_path): slug
-                for slug, url, dest_path in downloads
-            }
-            for future in concurrent.futures.as_completed(future_downloads):
-                slug = future_downloads[future]
-                try:
-                    future.result()
-                except Exception as ex:  # pylint: disable=broad-except
-                    logger.exception('%r failed: %s', slug, ex)
-                else:
-                    self.emit("icon-loaded", slug, media_type)
+        future_downloads = {
+            MEDIA_EXECUTOR.submit(download_media, url, dest_path): slug
+            for slug, url, dest_path in downloads
+        }
+        # Emit icon-loaded in batches so a big refresh doesn't schedule
+        # one main loop wakeup (and view update) per downloaded file.
+        completed_slugs = []
+        last_flush = time.monotonic()
+        for future in concurrent.futures.as_completed(list(future_downloads)):
+            slug = future_downloads.pop(future)
+            try:
+                future.result()
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.exception('%r failed: %s', slug, ex)
+            else:
+                completed_slugs.append(slug)
+            if completed_slugs and (
+                    len(completed_slugs) >= self.icon_flush_batch_size or time.monotonic() - last_flush > 0.05):
+                GLib.idle_add(self.emit_icons_loaded, completed_slugs, media_type)
+                completed_slugs = []
+                last_flush = time.monotonic()
+        if completed_slugs:
+            GLib.idle_add(self.emit_icons_loaded, completed_slugs, media_type)
         if media_type == "icon":
             update_desktop_icons()
 
+    def emit_icons_loaded(self, slugs, media_type):
+        """Emit icon-loaded for a batch of slugs; runs on the main loop"""
+        for slug in slugs:
+            self.emit("icon-loaded", slug, media_type)
+        return False
+
     def add_games_by_ids(self, game_ids):
         self.add_games(pga.get_games_by_ids(game_ids))
 
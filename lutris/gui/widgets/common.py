@@ -1,12 +1,16 @@
 """Misc widgets used in the GUI."""
 # Standard Library
+import bisect
+import functools
 import os
+import string
 
 from gettext import gettext as _
 from enum import Flag, auto
+from itertools import islice
 
 # Third Party Libraries
-from gi.repository import GObject, Gtk, Pango
+from gi.repository import GLib, GObject, Gtk
 
 # Lutris Modules
 from lutris.gui.widgets.utils import get_stock_icon
@@ -16,11 +20,49 @@ from lutris.util.linux import LINUX_SYSTEM
 from lutris.util.log import logger
 
 
+_WARNING_PIXBUF = None
+
+
+def _warning_pixbuf():
+    """Return the shared warning icon, decoding it only once per process"""
+    global _WARNING_PIXBUF  # pylint: disable=global-statement
+    if _WARNING_PIXBUF is None:
+        _WARNING_PIXBUF = get_stock_icon("dialog-warning", 32)
+    return _WARNING_PIXBUF
+
+
+class _RestrictiveTable(dict):
+    """Translation table that drops any character it doesn't map"""
+
+    def __missing__(self, _key):
+        return None
+
+
+# Single-pass, C-level character filters for the entry widgets below
+_SLUG_TABLE = _RestrictiveTable(str.maketrans(string.ascii_uppercase, string.ascii_lowercase))
+_SLUG_TABLE.update({ord(char): char for char in string.ascii_lowercase + string.digits + "-"})
+_NUMBER_TABLE = _RestrictiveTable({ord(char): char for char in string.digits})
+
+
+@functools.lru_cache(maxsize=64)
+def _list_dir_sorted(dirpath, _mtime_ns):
+    """Return the sorted, dotfile-free listing of a directory.
+
+    The directory's mtime is part of the cache key, so entries invalidate
+    themselves whenever the directory content changes.
+
+    A full sort is kept on purpose: a top-K selection (heapq.nsmallest)
+    would be cheaper for a single lookup, but the cached listing serves
+    every later keystroke via a bisect slice, which needs total order.
+    """
+    return tuple(sorted(entry.name for entry in os.scandir(dirpath) if not entry.name.startswith(".")))
+
+
 class SlugEntry(Gtk.Entry, Gtk.Editable):
 
     def do_insert_text(self, new_text, length, position):
         """Filter inserted characters to only accept alphanumeric and dashes"""
-        new_text = "".join([c for c in new_text if c.isalnum() or c == "-"]).lower()
+        new_text = new_text.translate(_SLUG_TABLE)
         length = len(new_text)
         self.get_buffer().insert_text(position, new_text, length)
         return position + length
@@ -30,7 +72,7 @@ class NumberEntry(Gtk.Entry, Gtk.Editable):
 
     def do_insert_text(self, new_text, length, position):
         """Filter inserted characters to only accept numbers"""
-        new_text = "".join([c for c in new_text if c.isnumeric()])
+        new_text = new_text.translate(_NUMBER_TABLE)
         if new_text:
             self.get_buffer().insert_text(position, new_text, length)
             return position + length
@@ -103,10 +145,15 @@ class FileChooserEntry(Gtk.Box):
         self.warn_if_ntfs = bool(warnings & FileChooserWarnings.NTFS)
 
         self.path_completion = Gtk.ListStore(str)
+        self._pending_check_id = 0
+        self._last_checked_text = None
+        self._main_file_path = None
+        self._main_file_cached = False
 
         self.entry = Gtk.Entry(visible=True)
         self.entry.set_completion(self.get_completion())
         self.entry.connect("changed", self.on_entry_changed)
+        self.connect("destroy", self.on_destroy)
         self.path_type = path_type
         self.install_path = install_path
         self.game = game
@@ -121,6 +168,39 @@ class FileChooserEntry(Gtk.Box):
         box.add(browse_button)
         self.pack_start(box, False, False, 0)
 
+        self._ntfs_warning = self._add_warning(_(
+            "<b>Warning!</b> The selected path is located on a drive formatted by Windows.\n"
+            "Games and programs installed on Windows drives usually <b>don't work</b>."
+        ), with_icon=True)
+        self._non_empty_warning = self._add_warning(_(
+            "<b>Warning!</b> The selected path "
+            "contains files. Installation might not work properly."
+        ))
+        self._non_writable_warning = self._add_warning(_(
+            "<b>Warning</b> The destination folder "
+            "is not writable by the current user."
+        ))
+
+    def _add_warning(self, markup, with_icon=False):
+        """Create a hidden warning widget, ready to be shown when relevant.
+
+        Creating the warnings once and toggling their visibility is much
+        cheaper than rebuilding widgets on every path check.
+        """
+        label = Gtk.Label(visible=with_icon)
+        label.set_markup(markup)
+        if with_icon:
+            widget = Gtk.Box(spacing=6)
+            warning_image = Gtk.Image(visible=True)
+            warning_image.set_from_pixbuf(_warning_pixbuf())
+            widget.add(warning_image)
+            widget.add(label)
+        else:
+            widget = label
+        widget.set_no_show_all(True)
+        self.pack_end(widget, False, False, 10)
+        return widget
+
     def get_text(self):
         """Return the entry's text"""
         return self.entry.get_text()
@@ -149,15 +229,20 @@ class FileChooserEntry(Gtk.Box):
         """Browse button click callback"""
         file_chooser_dialog = self.get_filechooser_dialog()
 
-        try:
-            main_file_path = self.game.runner.get_main_file()
-        except AttributeError:
-            main_file_path = None
+        # get_main_file can hit the filesystem, so look it up once per
+        # widget; the default path itself must be recomputed every click
+        # because default_path_handler tracks the last selected paths.
+        if not self._main_file_cached:
+            try:
+                self._main_file_path = self.game.runner.get_main_file()
+            except AttributeError:
+                self._main_file_path = None
+            self._main_file_cached = True
 
         def_path = default_path_handler.get(
             entry=self.get_text(),
             default=self.default_path,
-            main_file_path=main_file_path,
+            main_file_path=self._main_file_path,
             install_path=self.install_path,
             path_type=self.path_type)
 
@@ -172,41 +257,43 @@ class FileChooserEntry(Gtk.Box):
 
         file_chooser_dialog.run()
 
+    def on_destroy(self, _widget):
+        """Cancel any pending path check so it can't fire on a disposed widget"""
+        if self._pending_check_id:
+            GLib.source_remove(self._pending_check_id)
+            self._pending_check_id = 0
+
     def on_entry_changed(self, widget):
-        """Entry changed callback"""
+        """Entry changed callback
+
+        Debounced so that fast typing runs the filesystem checks once the
+        user pauses instead of once per character.
+        """
+        if self._pending_check_id:
+            GLib.source_remove(self._pending_check_id)
+        self._pending_check_id = GLib.timeout_add(150, self._do_entry_check, widget.get_text())
+
+    def _do_entry_check(self, path):
+        """Update the completion and warnings for the entered path"""
+        self._pending_check_id = 0
+        # "changed" also fires for programmatic set_text and double-fires
+        # on some bindings; don't redo the work for identical text.
+        if path == self._last_checked_text:
+            return GLib.SOURCE_REMOVE
+        self._last_checked_text = path
         self.clear_warnings()
-        path = widget.get_text()
         if not path:
-            return
+            return GLib.SOURCE_REMOVE
         path = os.path.expanduser(path)
         self.update_completion(path)
         if self.warn_if_ntfs and LINUX_SYSTEM.get_fs_type_for_path(path) == "ntfs":
-            ntfs_box = Gtk.Box(spacing=6, visible=True)
-            warning_image = Gtk.Image(visible=True)
-            warning_image.set_from_pixbuf(get_stock_icon("dialog-warning", 32))
-            ntfs_box.add(warning_image)
-            ntfs_label = Gtk.Label(visible=True)
-            ntfs_label.set_markup(_(
-                "<b>Warning!</b> The selected path is located on a drive formatted by Windows.\n"
-                "Games and programs installed on Windows drives usually <b>don't work</b>."
-            ))
-            ntfs_box.add(ntfs_label)
-            self.pack_end(ntfs_box, False, False, 10)
+            self._ntfs_warning.show()
         if self.warn_if_non_empty and os.path.exists(path) and os.listdir(path):
-            non_empty_label = Gtk.Label(visible=True)
-            non_empty_label.set_markup(_(
-                "<b>Warning!</b> The selected path "
-                "contains files. Installation might not work properly."
-            ))
-            self.pack_end(non_empty_label, False, False, 10)
+            self._non_empty_warning.show()
         parent = system.get_existing_parent(path)
         if parent is not None and not os.access(parent, os.W_OK):
-            non_writable_destination_label = Gtk.Label(visible=True)
-            non_writable_destination_label.set_markup(_(
-                "<b>Warning</b> The destination folder "
-                "is not writable by the current user."
-            ))
-            self.pack_end(non_writable_destination_label, False, False, 10)
+            self._non_writable_warning.show()
+        return GLib.SOURCE_REMOVE
 
     def on_select_file(self, dialog, response):
         """FileChooserDialog response callback"""
@@ -220,30 +307,38 @@ class FileChooserEntry(Gtk.Box):
 
     def update_completion(self, current_path):
         """Update the auto-completion widget with the current path"""
-        self.path_completion.clear()
+        # Detach the model while repopulating so the completion widget
+        # gets one update instead of a signal per row.
+        completion = self.entry.get_completion()
+        completion.set_model(None)
+        try:
+            self.path_completion.clear()
 
-        if not os.path.exists(current_path):
-            current_path, filefilter = os.path.split(current_path)
-        else:
-            filefilter = None
-
-        if os.path.isdir(current_path):
-            index = 0
-            for filename in sorted(os.listdir(current_path)):
-                if filename.startswith("."):
-                    continue
-                if filefilter is not None and not filename.startswith(filefilter):
-                    continue
-                self.path_completion.append([os.path.join(current_path, filename)])
-                index += 1
-                if index > self.max_completion_items:
-                    break
+            if not os.path.exists(current_path):
+                current_path, filefilter = os.path.split(current_path)
+            else:
+                filefilter = None
+
+            if os.path.isdir(current_path):
+                filenames = _list_dir_sorted(current_path, os.stat(current_path).st_mtime_ns)
+                start = bisect.bisect_left(filenames, filefilter) if filefilter else 0
+                prefix = current_path if current_path.endswith(os.sep) else current_path + os.sep
+                index = 0
+                for filename in islice(filenames, start, None):
+                    if filefilter is not None and not filename.startswith(filefilter):
+                        break
+                    self.path_completion.insert_with_valuesv(-1, [0], [prefix + filename])
+                    index += 1
+                    if index > self.max_completion_items:
+                        break
+        finally:
+            completion.set_model(self.path_completion)
 
     def clear_warnings(self):
-        """Delete all the warning labels from the container"""
-        for index, child in enumerate(self.get_children()):
-            if index > 0:
-                child.destroy()
+        """Hide all the warning widgets"""
+        self._ntfs_warning.hide()
+        self._non_empty_warning.hide()
+        self._non_writable_warning.hide()
 
 
 class Label(Gtk.Label):
@@ -252,6 +347,9 @@ class Label(Gtk.Label):
 
     def __init__(self, message=None):
         """Custom init of label."""
+        # Deferred so importing this module doesn't pay for the Pango
+        # typelib unless a Label is actually constructed.
+        from gi.repository import Pango  # pylint: disable=import-outside-toplevel
         super().__init__(label=message)
         self.set_line_wrap(True)
         self.set_max_width_chars(22)
@@ -285,6 +383,7 @@ class EditableGrid(Gtk.Grid):
 
     def __init__(self, data, columns):
         self.columns = columns
+        self._data_cache = None
         super().__init__()
         self.set_column_homogeneous(True)
         self.set_row_homogeneous(True)
@@ -332,20 +431,22 @@ class EditableGrid(Gtk.Grid):
         row_position = len(self.liststore) - 1
         self.treeview.set_cursor(row_position, None, False)
         self.treeview.scroll_to_cell(row_position, None, False, 0.0, 0.0)
+        self._data_cache = None
         self.emit("changed")
 
     def on_delete(self, widget):  # pylint: disable=unused-argument
         selection = self.treeview.get_selection()
         _, iteration = selection.get_selected()
         self.liststore.remove(iteration)
+        self._data_cache = None
         self.emit("changed")
 
     def on_text_edited(self, widget, path, text, field):  # pylint: disable=unused-argument
         self.liststore[path][field] = text.strip()  # pylint: disable=unsubscriptable-object
+        self._data_cache = None
         self.emit("changed")
 
     def get_data(self):  # pylint: disable=arguments-differ
-        model_data = []
-        for row in self.liststore:  # pylint: disable=not-an-iterable
-            model_data.append(row)
-        return model_data
+        if self._data_cache is None:
+            self._data_cache = [(row[0], row[1]) for row in self.liststore]  # pylint: disable=not-an-iterable
+        return self._data_cache
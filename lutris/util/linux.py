@@ -12,7 +12,7 @@ from collections import Counter, defaultdict
 
 # Lutris Modules
 from lutris.util import system
-from lutris.util.disks import get_drive_for_path
+from lutris.util.disks import find_mount_point, get_mountpoint_drives
 from lutris.util.graphics import drivers, glxinfo, vkquery
 from lutris.util.log import logger
 
@@ -241,11 +241,7 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
 
     def get_fs_type_for_path(self, path):
         """Return the filesystem type a given path uses"""
-        path_drive = get_drive_for_path(path)
-        for drive in self.get_drives():
-            for partition in drive.get("children", []):
-                if "/dev/%s" % partition["name"] == path_drive:
-                    return partition["fstype"]
+        return _get_fs_type_for_mountpoint(find_mount_point(path))
 
     def get_glxinfo(self):
         """Return a GlxInfo instance if the gfxinfo tool is available"""
@@ -372,6 +368,32 @@ class LinuxSystem:  # pylint: disable=too-many-public-methods
         return not self.get_missing_requirement_libs(feature)[0]
 
 
+_FS_TYPE_CACHE = {}
+
+
+def _get_fs_type_for_mountpoint(mount_point):
+    """Return the filesystem type for a mount point.
+
+    Cached because resolving it shells out to mount and lsblk; the mount
+    table changes rarely enough that repeat lookups can reuse the result.
+    Lookups made while lsblk is failing are not cached, so a transient
+    error doesn't pin a wrong answer for the whole session.
+    """
+    if mount_point in _FS_TYPE_CACHE:
+        return _FS_TYPE_CACHE[mount_point]
+    drives = LinuxSystem.get_drives()
+    if drives is None:
+        return None
+    fs_type = None
+    path_drive = get_mountpoint_drives().get(mount_point)
+    for drive in drives:
+        for partition in drive.get("children", []):
+            if "/dev/%s" % partition["name"] == path_drive:
+                fs_type = partition["fstype"]
+    _FS_TYPE_CACHE[mount_point] = fs_type
+    return fs_type
+
+
 class SharedLibrary:
 
     """Representation of a Linux shared library"""
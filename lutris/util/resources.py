@@ -1,12 +1,52 @@
 """Utility module to handle media resources"""
 import os
+import tempfile
+from email.utils import formatdate
 
+import urllib3
 from gi.repository import GLib
 
 from lutris import settings
 from lutris.util import system
-from lutris.util.http import HTTPError, Request
 from lutris.util.image_type import ImageType
+from lutris.util.log import logger
+
+
+def get_media_workers():
+    """Return the number of concurrent media downloads to allow.
+
+    Icon downloads are I/O bound, so the sweet spot is well above the CPU
+    count; the LUTRIS_MEDIA_WORKERS environment variable overrides the
+    default for users on unusually fast or slow links.
+    """
+    try:
+        return max(1, int(os.environ["LUTRIS_MEDIA_WORKERS"]))
+    except (KeyError, ValueError):
+        return min(32, (os.cpu_count() or 4) * 4)
+
+
+MEDIA_WORKERS = get_media_workers()
+
+_DOWNLOAD_POOL = None
+
+
+def get_download_pool():
+    """Return the process wide connection pool used for media downloads.
+
+    Sharing a single PoolManager keeps connections alive between downloads,
+    saving a TCP + TLS handshake for every icon served from the same host.
+    """
+    global _DOWNLOAD_POOL  # pylint: disable=global-statement
+    if _DOWNLOAD_POOL is None:
+        _DOWNLOAD_POOL = urllib3.PoolManager(
+            num_pools=16,
+            maxsize=MEDIA_WORKERS,
+            block=False,
+            retries=urllib3.Retry(total=2, backoff_factor=0.2),
+            timeout=urllib3.Timeout(connect=10, read=30),
+            headers={"User-Agent": "{} {}".format(settings.PROJECT, settings.VERSION)},
+        )
+    return _DOWNLOAD_POOL
 
 
 def get_image_path(game_slug, image_type=ImageType.icon):
@@ -37,16 +77,86 @@ def update_desktop_icons():
         os.system("gtk-update-icon-cache -tf %s" % os.path.join(GLib.get_user_data_dir(), "icons", "hicolor"))
 
 
+# Captured once at import, which is single-threaded: os.umask is
+# process-global, so probing it from concurrent download workers could
+# corrupt the process umask.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_MEDIA_FILE_MODE = 0o666 & ~_UMASK
+
+_ETAG_XATTR = "user.lutris.etag"
+
+
+def _read_etag(path):
+    """Return the ETag stored alongside a downloaded file, if any"""
+    try:
+        return os.getxattr(path, _ETAG_XATTR).decode()
+    except OSError:
+        return None
+
+
+def _save_etag(path, etag):
+    """Store the server provided ETag in an extended attribute"""
+    if not etag:
+        return
+    try:
+        os.setxattr(path, _ETAG_XATTR, etag.encode())
+    except OSError:
+        # Not all filesystems support user xattrs; revalidation then
+        # falls back to If-Modified-Since alone.
+        pass
+
+
 def download_media(url, dest, overwrite=False):
     """Save a remote media locally"""
+    pool = get_download_pool()
+    headers = None
     if system.path_exists(dest):
-        if overwrite:
-            os.remove(dest)
-        else:
+        if not overwrite:
             return dest
+        # Revalidate instead of redownloading: a 304 means the local
+        # copy is still current and only costs a headers-only roundtrip.
+        headers = dict(pool.headers)
+        headers["If-Modified-Since"] = formatdate(os.path.getmtime(dest), usegmt=True)
+        etag = _read_etag(dest)
+        if etag:
+            headers["If-None-Match"] = etag
     try:
-        request = Request(url).get()
-    except HTTPError:
+        response = pool.request("GET", url, headers=headers, preload_content=False)
+    except urllib3.exceptions.HTTPError as ex:
+        logger.error("Unable to download %s: %s", url, ex)
+        return
+    try:
+        if response.status == 304:
+            return dest
+        if response.status > 299:
+            logger.warning("%s responded with code %s", url, response.status)
+            return
+        # Stream to a temporary file then rename so incomplete downloads
+        # never show up under the destination path.
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(dest), delete=False) as dest_file:
+            try:
+                for chunk in response.stream(64 * 1024):
+                    dest_file.write(chunk)
+                dest_file.flush()
+                # NamedTemporaryFile creates 0600 files and rename keeps
+                # that mode; restore what open() would have produced
+                # under the user's umask.
+                os.fchmod(dest_file.fileno(), _MEDIA_FILE_MODE)
+                # Icons are read back by the UI at most once; don't let
+                # their pages crowd out more useful entries in the cache.
+                os.posix_fadvise(dest_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            except BaseException:
+                os.unlink(dest_file.name)
+                raise
+        os.rename(dest_file.name, dest)
+        _save_etag(dest, response.headers.get("ETag"))
+    except urllib3.exceptions.HTTPError as ex:
+        # With preload_content=False the request returns after the
+        # headers, so transfer errors surface while streaming the body;
+        # callers rely on download_media logging instead of raising.
+        logger.error("Unable to download %s: %s", url, ex)
         return
-    request.write_to_file(dest)
+    finally:
+        response.release_conn()
     return dest